@@ -1,11 +1,15 @@
 use opendal::raw::{build_rooted_abs_path, normalize_path, normalize_root};
-use opendal::{EntryMode, ErrorKind, Operator, Scheme};
+use opendal::{EntryMode, ErrorKind, Operator, Scheme, Writer};
+use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::{PyException, PyFileNotFoundError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDateTime, PyDict};
+use pyo3::types::{PyBytes, PyDateTime, PyDict};
 use pyo3_async_runtimes::tokio::future_into_py;
 use std::collections::HashMap;
+use std::ops::Bound as RangeBound;
 use std::str::FromStr;
+use std::sync::Arc;
+use tokio::sync::Mutex;
 
 #[pyclass(subclass)]
 pub struct OpendalFileSystem {
@@ -221,15 +225,43 @@ impl OpendalFileSystem {
     }
 
     /// Private helper method to read file contents
-    fn _read<'p>(&self, py: Python<'p>, path: &str) -> PyResult<Bound<'p, PyAny>> {
+    ///
+    /// `start`/`end` restrict the read to the byte range `[start, end)`, which
+    /// is issued as a single ranged request instead of fetching the whole file.
+    /// `concurrent`/`chunk` split the read into `chunk`-sized ranged requests
+    /// with up to `concurrent` of them in flight.
+    #[pyo3(signature = (path, start=None, end=None, concurrent=None, chunk=None))]
+    fn _read<'p>(
+        &self,
+        py: Python<'p>,
+        path: &str,
+        start: Option<u64>,
+        end: Option<u64>,
+        concurrent: Option<usize>,
+        chunk: Option<usize>,
+    ) -> PyResult<Bound<'p, PyAny>> {
         let path = normalize_path(path);
+        let range = (
+            start.map_or(RangeBound::Unbounded, RangeBound::Included),
+            end.map_or(RangeBound::Unbounded, RangeBound::Excluded),
+        );
         let op = self.op.clone();
 
         future_into_py(py, async move {
-            match op.read(&path).await {
+            let mut read = op.read_with(&path).range(range);
+            if let Some(concurrent) = concurrent {
+                read = read.concurrent(concurrent);
+            }
+            if let Some(chunk) = chunk {
+                read = read.chunk(chunk);
+            }
+
+            match read.await {
                 Ok(data) => {
-                    let bytes = data.to_vec();
-                    Python::with_gil(|py| Ok(bytes.into_py(py)))
+                    // Hand back a single `bytes` object; a `Vec<u8>` would be
+                    // converted to a list of ints on the Python side.
+                    let bytes = data.to_bytes();
+                    Python::with_gil(|py| Ok(PyBytes::new_bound(py, &bytes).into_py(py)))
                 }
                 Err(e) => Err(PyException::new_err(e.to_string())),
             }
@@ -237,17 +269,83 @@ impl OpendalFileSystem {
     }
 
     /// Private helper method to write file contents
-    fn _write<'p>(&self, py: Python<'p>, path: &str, data: Vec<u8>) -> PyResult<Bound<'p, PyAny>> {
+    ///
+    /// Accepts any object exposing the buffer protocol (bytes, bytearray,
+    /// memoryview, ...), copying it once instead of extracting it item by item.
+    /// `concurrent`/`chunk` upload the data as `chunk`-sized parts with up to
+    /// `concurrent` of them in flight (e.g. S3 multipart uploads).
+    /// `append` adds the data to the end of an existing file; only valid when
+    /// `write_can_append` is true.
+    #[pyo3(signature = (path, data, concurrent=None, chunk=None, append=false))]
+    fn _write<'p>(
+        &self,
+        py: Python<'p>,
+        path: &str,
+        data: PyBuffer<u8>,
+        concurrent: Option<usize>,
+        chunk: Option<usize>,
+        append: bool,
+    ) -> PyResult<Bound<'p, PyAny>> {
         let path = normalize_path(path);
+        let data = data.to_vec(py)?;
         let op = self.op.clone();
 
         future_into_py(py, async move {
-            op.write(&path, data)
+            let mut write = op.write_with(&path, data).append(append);
+            if let Some(concurrent) = concurrent {
+                write = write.concurrent(concurrent);
+            }
+            if let Some(chunk) = chunk {
+                write = write.chunk(chunk);
+            }
+
+            write
                 .await
                 .map_err(|e| PyException::new_err(e.to_string()))?;
             Python::with_gil(|py| Ok(py.None()))
         })
     }
+
+    /// Private helper method to open a streaming writer
+    ///
+    /// Data passed to the returned writer is uploaded as it arrives instead of
+    /// being collected first; `concurrent`/`chunk`/`append` behave as in `_write`.
+    #[pyo3(signature = (path, concurrent=None, chunk=None, append=false))]
+    fn _writer<'p>(
+        &self,
+        py: Python<'p>,
+        path: &str,
+        concurrent: Option<usize>,
+        chunk: Option<usize>,
+        append: bool,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        let path = normalize_path(path);
+        let op = self.op.clone();
+
+        future_into_py(py, async move {
+            let mut writer = op.writer_with(&path).append(append);
+            if let Some(concurrent) = concurrent {
+                writer = writer.concurrent(concurrent);
+            }
+            if let Some(chunk) = chunk {
+                writer = writer.chunk(chunk);
+            }
+
+            let writer = writer
+                .await
+                .map_err(|e| PyException::new_err(e.to_string()))?;
+            Ok(OpendalWriter {
+                inner: Arc::new(Mutex::new(Some(writer))),
+            })
+        })
+    }
+
+    /// Whether the backend can append to existing files natively
+    #[getter]
+    fn write_can_append(&self) -> bool {
+        self.op.info().full_capability().write_can_append
+    }
+
     fn modified<'py>(&self, py: Python<'py>, path: &str) -> PyResult<Bound<'py, PyAny>> {
         let path = normalize_path(path);
         let op = self.op.clone();
@@ -291,3 +389,62 @@ impl OpendalFileSystem {
         })
     }
 }
+
+/// Streaming writer returned by `OpendalFileSystem._writer`
+#[pyclass]
+pub struct OpendalWriter {
+    inner: Arc<Mutex<Option<Writer>>>,
+}
+
+#[pymethods]
+impl OpendalWriter {
+    /// Write the contents of any buffer-protocol object
+    ///
+    /// The data is copied once; parts are uploaded as they fill up.
+    fn write<'p>(&self, py: Python<'p>, data: PyBuffer<u8>) -> PyResult<Bound<'p, PyAny>> {
+        let data = data.to_vec(py)?;
+        let inner = self.inner.clone();
+
+        future_into_py(py, async move {
+            let mut guard = inner.lock().await;
+            let writer = guard
+                .as_mut()
+                .ok_or_else(|| PyValueError::new_err("Writer is closed"))?;
+            writer
+                .write(data)
+                .await
+                .map_err(|e| PyException::new_err(e.to_string()))?;
+            Python::with_gil(|py| Ok(py.None()))
+        })
+    }
+
+    /// Finish the upload; nothing is visible until this completes
+    fn close<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
+        let inner = self.inner.clone();
+
+        future_into_py(py, async move {
+            if let Some(mut writer) = inner.lock().await.take() {
+                writer
+                    .close()
+                    .await
+                    .map_err(|e| PyException::new_err(e.to_string()))?;
+            }
+            Python::with_gil(|py| Ok(py.None()))
+        })
+    }
+
+    /// Abort the upload, discarding any parts already sent
+    fn abort<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
+        let inner = self.inner.clone();
+
+        future_into_py(py, async move {
+            if let Some(mut writer) = inner.lock().await.take() {
+                writer
+                    .abort()
+                    .await
+                    .map_err(|e| PyException::new_err(e.to_string()))?;
+            }
+            Python::with_gil(|py| Ok(py.None()))
+        })
+    }
+}
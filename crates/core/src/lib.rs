@@ -1,2 +1,2 @@
 mod fs;
-pub use fs::OpendalFileSystem;
+pub use fs::{OpendalFileSystem, OpendalWriter};
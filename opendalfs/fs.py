@@ -1,13 +1,60 @@
+import asyncio
+import bisect
 import importlib
+from collections.abc import Iterable
 from typing import Any, List, Dict
-from fsspec.asyn import AsyncFileSystem, sync, sync_wrapper
+from fsspec.asyn import (
+    AbstractAsyncStreamedFile,
+    AsyncFileSystem,
+    sync,
+    sync_wrapper,
+)
 from fsspec.spec import AbstractBufferedFile
+from fsspec.utils import merge_offset_ranges
 import io
 import logging
 import time
 
 logger = logging.getLogger("opendalfs")
 
+# Options consumed on the Python side and never forwarded to the backend
+_PYTHON_KWARGS = (
+    "asynchronous",
+    "loop",
+    "read_concurrent",
+    "read_chunk",
+    "write_concurrent",
+    "write_chunk",
+    "default_block_size",
+    "default_cache_type",
+)
+
+# Payload types handed to the Rust core as-is
+_BYTES_TYPES = (bytes, bytearray)
+
+
+def _as_buffer(data: Any) -> Any:
+    """Return ``data`` as a flat byte buffer the Rust core can read directly
+
+    Any buffer-protocol object (bytes, bytearray, NumPy/Arrow buffers, ...) is
+    re-viewed as unsigned bytes instead of being copied.
+    """
+    if type(data) in _BYTES_TYPES:
+        return data  # Already flat bytes; skip building a view
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, io.BytesIO):
+        return data.getbuffer()
+    try:
+        mv = memoryview(data)
+    except TypeError:
+        raise TypeError(
+            f"Expected a bytes-like object, got {type(data).__name__}"
+        ) from None
+    if mv.c_contiguous:
+        return mv.cast("B")
+    return mv.tobytes()  # Non-contiguous views need a packed copy
+
 
 class OpendalFileSystem(AsyncFileSystem):
     """OpenDAL implementation of fsspec AsyncFileSystem.
@@ -37,23 +84,43 @@ class OpendalFileSystem(AsyncFileSystem):
             Whether to return async versions of methods (default: False)
         loop : event loop (optional)
             Specific event loop to use
+        read_concurrent : int (optional)
+            Number of ranged requests kept in flight when reading a file
+        read_chunk : int (optional)
+            Size in bytes of each ranged request when reading a file
+        write_concurrent : int (optional)
+            Number of parts uploaded in parallel when writing a file
+        write_chunk : int (optional)
+            Size in bytes of each uploaded part when writing a file
+        default_block_size : int (optional)
+            Block size used by ``open`` when none is given (default: 50 MiB)
+        default_cache_type : str (optional)
+            Read cache used by ``open`` when none is given (default: 'readahead').
+            'background' fetches the next block in a thread while the current
+            one is consumed, hiding a round-trip per block on sequential reads
         **kwargs : dict
             Passed to backend implementation
         """
         super().__init__(asynchronous=asynchronous, loop=loop, *args, **kwargs)
         self.scheme = scheme
+        self.read_concurrent = kwargs.get("read_concurrent")
+        self.read_chunk = kwargs.get("read_chunk")
+        self.write_concurrent = kwargs.get("write_concurrent")
+        self.write_chunk = kwargs.get("write_chunk")
+        self.default_block_size = kwargs.get("default_block_size", 50 * 2**20)
+        self.default_cache_type = kwargs.get("default_cache_type", "readahead")
         try:
             module = importlib.import_module(f"opendalfs_service_{scheme}")
             fs_class = getattr(module, f"{scheme.capitalize()}FileSystem")
-            # Filter out fsspec-specific kwargs
-            rust_kwargs = {
-                k: v for k, v in kwargs.items() if k not in ("asynchronous", "loop")
-            }
+            # Filter out fsspec-specific and opendalfs-level kwargs
+            rust_kwargs = {k: v for k, v in kwargs.items() if k not in _PYTHON_KWARGS}
             self.fs = fs_class(**rust_kwargs)
         except ImportError:
             raise ImportError(f"Cannot import opendal_service_{scheme}")
         except AttributeError:
             raise AttributeError(f"Cannot find {scheme.capitalize()}FileSystem")
+        # Backend capabilities are fixed per operator; read them once
+        self.write_can_append = self.fs.write_can_append
 
     async def _call_rust(self, future):
         """Helper to properly await Rust futures with consistent error handling"""
@@ -86,7 +153,7 @@ class OpendalFileSystem(AsyncFileSystem):
 
     async def _info(self, path: str) -> Dict[str, Any]:
         """Get path info"""
-        logger.debug(f"Getting info for: {path}")
+        logger.debug("Getting info for: %s", path)
         future = self.fs.info(path)
         return await self._call_rust(future)
 
@@ -139,11 +206,17 @@ class OpendalFileSystem(AsyncFileSystem):
         """Sync version of rm_file"""
         return sync(self.loop, self._rm_file, path)
 
-    async def _read(self, path: str) -> bytes:
-        """Read file contents"""
+    async def _read(self, path: str, start: int = None, end: int = None) -> bytes:
+        """Read file contents, or only the byte range [start, end) if given"""
         try:
-            logger.debug(f"Reading file: {path}")
-            future = self.fs._read(path)
+            logger.debug("Reading file: %s [%s:%s]", path, start, end)
+            future = self.fs._read(
+                path,
+                start=start,
+                end=end,
+                concurrent=self.read_concurrent,
+                chunk=self.read_chunk,
+            )
             if future is None:
                 raise OSError(f"Rust _read returned None for {path}")
 
@@ -151,26 +224,42 @@ class OpendalFileSystem(AsyncFileSystem):
             if not isinstance(result, bytes):
                 result = bytes(result)
             return result
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Read failed: {e}", exc_info=True)
             raise OSError(f"Failed to read {path}: {e}")
 
-    async def _write(self, path: str, data: bytes) -> None:
-        """Write file contents"""
-        try:
-            logger.debug(f"Writing {len(data)} bytes to {path}")
+    async def _write(
+        self,
+        path: str,
+        data: bytes,
+        concurrent: int = None,
+        chunk: int = None,
+        append: bool = False,
+    ) -> None:
+        """Write file contents
 
-            if isinstance(data, io.BytesIO):
-                data = data.getvalue()
-            elif not isinstance(data, bytes):
-                data = str(data).encode()
+        ``concurrent``/``chunk`` override ``write_concurrent``/``write_chunk``
+        for this write only. ``append`` adds to the end of an existing file
+        and requires a backend with native append support.
+        """
+        data = _as_buffer(data)
+        try:
+            logger.debug("Writing %s bytes to %s", len(data), path)
 
-            future = self.fs._write(path, data)
+            future = self.fs._write(
+                path,
+                data,
+                concurrent=concurrent or self.write_concurrent,
+                chunk=chunk or self.write_chunk,
+                append=append,
+            )
             if future is None:
                 raise OSError(f"Rust _write returned None for {path}")
 
             await self._call_rust(future)
-            logger.debug(f"Write completed successfully to {path}")
+            logger.debug("Write completed successfully to %s", path)
 
         except Exception as e:
             logger.error(f"Write failed to {path}: {e}", exc_info=True)
@@ -181,7 +270,7 @@ class OpendalFileSystem(AsyncFileSystem):
     def _write_sync(self, path: str, data: bytes) -> None:
         """Synchronous version of write"""
         try:
-            logger.debug(f"_write_sync: Writing {len(data)} bytes to {path}")
+            logger.debug("_write_sync: Writing %s bytes to %s", len(data), path)
             result = sync(self.loop, self._write, path, data)
             logger.debug("_write_sync: Write completed successfully")
             return result
@@ -189,10 +278,130 @@ class OpendalFileSystem(AsyncFileSystem):
             logger.error(f"_write_sync: Write failed to {path}: {e}", exc_info=True)
             raise OSError(f"Failed to write to {path}: {e}")
 
+    async def _writer(
+        self,
+        path: str,
+        concurrent: int = None,
+        chunk: int = None,
+        append: bool = False,
+    ) -> Any:
+        """Open a streaming writer on path
+
+        Data written to it is uploaded as it arrives, in parts of
+        ``write_chunk`` bytes with up to ``write_concurrent`` in flight; the
+        file only appears once the writer is closed.
+        """
+        logger.debug("Opening writer on %s", path)
+        future = self.fs._writer(
+            path,
+            concurrent=concurrent or self.write_concurrent,
+            chunk=chunk or self.write_chunk,
+            append=append,
+        )
+        return await self._call_rust(future)
+
+    async def _cat_file(self, path: str, start=None, end=None, **kwargs) -> bytes:
+        """Read file contents, optionally restricted to a byte range"""
+        if start or end is not None:
+            # Negative offsets need the size, and ranges past EOF are
+            # truncated to it rather than sent as unsatisfiable requests
+            size = (await self._info(path))["size"]
+            start, end, _ = slice(start, end).indices(size)
+            if start >= end:
+                return b""
+        return await self._read(path, start=start, end=end)
+
+    async def _cat_ranges(
+        self,
+        paths: List[str],
+        starts,
+        ends,
+        max_gap: int = None,
+        batch_size: int = None,
+        on_error: str = "return",
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Read byte ranges from one or more files concurrently
+
+        With ``max_gap``, ranges of the same file that are at most ``max_gap``
+        bytes apart are fetched as a single ranged read and split locally.
+        """
+        if max_gap is None:
+            return await super()._cat_ranges(
+                paths,
+                starts,
+                ends,
+                batch_size=batch_size,
+                on_error=on_error,
+                **kwargs,
+            )
+
+        starts = list(starts) if isinstance(starts, Iterable) else [starts] * len(paths)
+        ends = list(ends) if isinstance(ends, Iterable) else [ends] * len(paths)
+        offsets = [o for o in starts + ends if o is not None]
+        if any(o < 0 for o in offsets):
+            # Offsets from the end of the file are resolved per range
+            return await super()._cat_ranges(
+                paths,
+                starts,
+                ends,
+                batch_size=batch_size,
+                on_error=on_error,
+                **kwargs,
+            )
+
+        mpaths, mstarts, mends = merge_offset_ranges(
+            list(paths), starts, ends, max_gap=max_gap
+        )
+        blocks = await super()._cat_ranges(
+            mpaths, mstarts, mends, batch_size=batch_size, on_error=on_error, **kwargs
+        )
+
+        # Merged blocks are sorted and disjoint per path, so the block holding
+        # a range is the last one starting at or before it
+        spans: Dict[str, tuple] = {}
+        for i, mpath in enumerate(mpaths):
+            spans[mpath] = (spans.get(mpath, (i,))[0], i + 1)
+        out = []
+        for path, start, end in zip(paths, starts, ends):
+            start = start or 0
+            lo, hi = spans[path]
+            i = bisect.bisect_right(mstarts, start, lo, hi) - 1
+            block = blocks[i]
+            if isinstance(block, Exception):
+                out.append(block)
+            else:
+                offset = mstarts[i]
+                out.append(
+                    block[start - offset : None if end is None else end - offset]
+                )
+        return out
+
+    async def _pipe_file(
+        self, path: str, value: bytes, mode: str = "overwrite", **kwargs
+    ) -> None:
+        """Write bytes to path
+
+        Multi-path ``pipe``/``cat`` calls are fanned out concurrently by
+        fsspec (see ``batch_size``), so bulk writes overlap their round-trips
+        instead of running one after another. ``mode="create"`` refuses to
+        replace an existing file. The check is best-effort: it is a separate
+        request before the write, so two concurrent creators can both pass
+        it and the later write wins.
+        """
+        if mode == "create" and await self._exists(path):
+            raise FileExistsError(f"File {path} already exists")
+        await self._write(
+            path,
+            value,
+            concurrent=kwargs.get("write_concurrent"),
+            chunk=kwargs.get("write_chunk"),
+        )
+
     # Higher-level async operations built on core methods
     async def _exists(self, path: str) -> bool:
         """Check path existence"""
-        logger.debug(f"Checking existence of: {path}")
+        logger.debug("Checking existence of: %s", path)
         try:
             # Try both with and without trailing slash for directories
             paths_to_check = [path]
@@ -206,7 +415,7 @@ class OpendalFileSystem(AsyncFileSystem):
 
             return False
         except Exception as e:
-            logger.debug(f"Existence check failed: {e}")
+            logger.debug("Existence check failed: %s", e)
             return False
 
     async def _isfile(self, path: str) -> bool:
@@ -239,35 +448,50 @@ class OpendalFileSystem(AsyncFileSystem):
     isfile = sync_wrapper(_isfile)
     isdir = sync_wrapper(_isdir)
 
+    async def _check_parents(self, path: str) -> None:
+        """Raise NotADirectoryError if any parent of path is a file
+
+        Issues one stat per parent, concurrently; parents that cannot be
+        stat'ed are virtual directories.
+        """
+        parts = path.split("/")
+        parents = ["/".join(parts[: i + 1]) for i in range(len(parts) - 1)]
+        parents = [parent for parent in parents if parent]
+        infos = await asyncio.gather(
+            *(self._info(parent) for parent in parents), return_exceptions=True
+        )
+        for parent, info in zip(parents, infos):
+            if isinstance(info, dict) and info["type"] == "file":
+                raise NotADirectoryError(
+                    f"Parent path '{parent}' is a file, cannot write '{path}' through it"
+                )
+
     def _open(
         self,
         path: str,
         mode: str = "rb",
-        block_size: int = 50 * 2**20,
+        block_size: int = None,
         autocommit: bool = True,
-        cache_type: str = "readahead",
+        cache_type: str = None,
         cache_options: dict = None,
         **kwargs: Any,
     ) -> "OpendalBufferedFile":
         """Open a file for reading or writing"""
+        # fsspec's open() passes block_size=None, so defaults are resolved here
+        block_size = block_size or self.default_block_size
+        cache_type = cache_type or self.default_cache_type
+        size = None
         try:
             if "r" in mode:
                 # Only check existence for read modes
                 info = self.info(path)
                 if info["type"] != "file":
                     raise IsADirectoryError(f"{path} is not a file")
+                size = info["size"]  # Saves the file a second stat
             elif "w" in mode or "a" in mode:
                 # For write modes, only check if we're trying to write through a file
                 if "/" in path:
-                    parts = path.split("/")
-                    for i in range(len(parts) - 1):
-                        parent = "/".join(parts[: i + 1])
-                        if parent and self.exists(parent):
-                            info = self.info(parent)
-                            if info["type"] == "file":
-                                raise NotADirectoryError(
-                                    f"Parent path '{parent}' is a file, cannot write '{path}' through it"
-                                )
+                    sync(self.loop, self._check_parents, path)
 
             return OpendalBufferedFile(
                 self,
@@ -277,6 +501,7 @@ class OpendalFileSystem(AsyncFileSystem):
                 autocommit=autocommit,
                 cache_type=cache_type,
                 cache_options=cache_options,
+                size=size,
                 **kwargs,
             )
 
@@ -292,11 +517,35 @@ class OpendalFileSystem(AsyncFileSystem):
                 autocommit=autocommit,
                 cache_type=cache_type,
                 cache_options=cache_options,
+                size=size,
                 **kwargs,
             )
         except Exception as e:
             raise OSError(f"Error opening file: {e}")
 
+    async def open_async(
+        self, path: str, mode: str = "rb", **kwargs: Any
+    ) -> "OpendalAsyncStreamedFile":
+        """Open a file for streamed async reading or writing
+
+        Lets callers overlap IO across many files with ``asyncio.gather``
+        on the event loop rather than a thread pool. In read mode,
+        ``prefetch=k`` keeps the next ``k`` blocks of ``block_size`` bytes
+        downloading in the background while the current one is consumed.
+        """
+        if "b" not in mode or kwargs.get("compression"):
+            raise ValueError("Only binary modes without compression are supported")
+        size = None
+        if "r" in mode:
+            info = await self._info(path)
+            if info["type"] != "file":
+                raise IsADirectoryError(f"{path} is not a file")
+            size = info["size"]
+        block_size = kwargs.pop("block_size", None) or self.default_block_size
+        return OpendalAsyncStreamedFile(
+            self, path, mode=mode, block_size=block_size, size=size, **kwargs
+        )
+
     def created(self, path: str) -> None:
         """Get creation time (not supported)"""
         raise NotImplementedError("Creation time is not supported by OpenDAL")
@@ -330,19 +579,16 @@ class OpendalFileSystem(AsyncFileSystem):
         try:
             return sync(self.loop, self._read, path)
         except Exception as e:
-            if "not found" in str(e).lower():
+            if isinstance(e, FileNotFoundError) or "not found" in str(e).lower():
                 raise FileNotFoundError(f"File {path} not found")
             raise OSError(f"Failed to read {path}: {e}")
 
     def write(self, path: str, data: bytes) -> None:
         """Sync version of write"""
         try:
-            if isinstance(data, io.BytesIO):
-                data = data.getvalue()
-            elif not isinstance(data, bytes):
-                data = str(data).encode()
-
             sync(self.loop, self._write, path, data)
+        except TypeError:
+            raise
         except Exception as e:
             logger.error(f"Write failed: {e}", exc_info=True)
             raise OSError(f"Failed to write to {path}: {e}")
@@ -352,6 +598,52 @@ class OpendalFileSystem(AsyncFileSystem):
         return sync(self.loop, self._info, path)
 
 
+async def _upload_block(f: AbstractBufferedFile, final: bool) -> None:
+    """Stream the buffered block of ``f``, finishing the file on ``final``
+
+    Blocks go through a single OpenDAL writer, so only the current block is
+    held in memory rather than the whole file. Without native append
+    support, append mode first copies the existing content into the writer
+    block by block.
+    """
+    fs = f.fs
+    data = f.buffer.getbuffer()  # Zero-copy view of the buffered bytes
+    try:
+        if f._writer is None:
+            append = "a" in f.mode and fs.write_can_append
+            existing = 0
+            if "a" in f.mode and not append:
+                try:
+                    info = await fs._info(f.path)
+                    if info["type"] == "file":
+                        existing = info["size"]
+                        if final and not data:
+                            return  # Nothing to append
+                except FileNotFoundError:
+                    pass  # File doesn't exist yet
+            f._writer = await fs._writer(
+                f.path,
+                concurrent=f.kwargs.get("write_concurrent"),
+                chunk=f.kwargs.get("write_chunk"),
+                append=append,
+            )
+            for start in range(0, existing, f.blocksize):
+                end = min(start + f.blocksize, existing)
+                await f._writer.write(await fs._read(f.path, start=start, end=end))
+        if data:
+            await f._writer.write(data)
+        if final:
+            await f._writer.close()
+            logger.debug("Finished writing %s", f.path)
+    except Exception:
+        if f._writer is not None:
+            try:
+                await f._writer.abort()
+            except Exception:
+                pass  # Keep the original error
+        raise
+
+
 class OpendalBufferedFile(AbstractBufferedFile):
     """Buffered file implementation for OpenDAL"""
 
@@ -378,6 +670,7 @@ class OpendalBufferedFile(AbstractBufferedFile):
             size=size,
             **kwargs,
         )
+        self._writer = None
 
     async def _call_rust(self, future):
         """Helper to properly await Rust futures"""
@@ -391,75 +684,100 @@ class OpendalBufferedFile(AbstractBufferedFile):
 
     def _fetch_range(self, start: int, end: int) -> bytes:
         """Download data between start and end"""
+        # Block caches ask for whole blocks, so the last one reaches past EOF
+        end = min(end, self.size)
+        if start >= end:
+            return b""
         try:
-            logger.debug(f"Fetching range {start}-{end} from {self.path}")
-            data = self.fs.read(self.path)
-            if not isinstance(data, bytes):
-                data = bytes(data)
-            return data[start:end]
+            logger.debug("Fetching range %s-%s from %s", start, end, self.path)
+            # Ranged read: only the requested block crosses the wire
+            return sync(self.fs.loop, self.fs._read, self.path, start=start, end=end)
         except Exception as e:
-            logger.debug(f"Fetch range failed: {e}")
+            logger.debug("Fetch range failed: %s", e)
             if "not found" in str(e).lower():
                 raise FileNotFoundError(f"File {self.path} not found")
             raise OSError(str(e))
 
     def _upload_chunk(self, final: bool = False) -> bool:
-        """Upload partial chunk of data"""
+        """Upload the buffered block, finishing the file on the final one"""
         try:
-            data = self.buffer.getvalue()
-            if not data:  # Empty buffer
-                return True
-
-            if isinstance(data, io.BytesIO):
-                data = data.getvalue()
-            elif not isinstance(data, bytes):
-                data = str(data).encode()
-
-            # For append mode, read existing content first
-            if "a" in self.mode:
-                try:
-                    existing = self.fs.read(self.path)
-                    data = existing + data
-                except FileNotFoundError:
-                    pass  # File doesn't exist yet
-
-            # Clear the buffer first
-            self.buffer.seek(0)
-            self.buffer.truncate()
-
-            # Write the data
-            try:
-                self.fs.write(self.path, data)
-                logger.debug(f"Successfully wrote {len(data)} bytes to {self.path}")
-                return True
-            except Exception as e:
-                logger.error(f"Write failed in _upload_chunk: {e}", exc_info=True)
-                return False
-
+            sync(self.fs.loop, _upload_block, self, final)
         except Exception as e:
-            logger.error(f"Upload failed in buffer handling: {e}", exc_info=True)
-            return False
+            logger.error(f"Error writing {self.path}: {e}", exc_info=True)
+            raise OSError(f"Failed to write file {self.path}: {e}")
+        return True
 
     def _initiate_upload(self) -> None:
         """Prepare for uploading"""
         pass
 
-    def _commit_upload(self) -> None:
-        """Ensure upload is complete"""
-        if self._upload_chunk(final=True) is False:
-            raise OSError("Upload failed")
 
-    def close(self):
-        """Ensure data is written before closing"""
-        if self.mode == "wb":
-            try:
-                if not self._upload_chunk(final=True):
-                    logger.error(f"Failed to write file on close: {self.path}")
-                    raise OSError(f"Failed to write file {self.path} on close")
-            except Exception as e:
-                logger.error(f"Error during close of {self.path}: {e}", exc_info=True)
-                raise OSError(f"Failed to write file {self.path} on close: {e}")
-        super().close()
+class OpendalAsyncStreamedFile(AbstractAsyncStreamedFile):
+    """Async streamed file implementation for OpenDAL"""
+
+    def __init__(self, *args: Any, prefetch: int = 0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.prefetch = prefetch
+        self._blocks: Dict[int, asyncio.Future] = {}
+        self._writer = None
+
+    async def _fetch_range(self, start: int, end: int) -> bytes:
+        """Download data between start and end"""
+        logger.debug("Fetching range %s-%s from %s", start, end, self.path)
+        # Reads past EOF would request an unsatisfiable range
+        end = min(end, self.size)
+        if start >= end:
+            return b""
+        if not self.prefetch:
+            return await self.fs._read(self.path, start=start, end=end)
+
+        bs = self.blocksize
+        first, last = start // bs, (end - 1) // bs
+        nblocks = -(-self.size // bs)
+
+        # Keep at most the blocks in [first, last + prefetch], dropping failed
+        # ones so they are retried, then keep the next ones in flight
+        for block, future in list(self._blocks.items()):
+            failed = future.done() and (
+                future.cancelled() or future.exception() is not None
+            )
+            if block < first or block > last + self.prefetch or failed:
+                self._blocks.pop(block).cancel()
+        for block in range(first, min(last + 1 + self.prefetch, nblocks)):
+            if block not in self._blocks:
+                self._blocks[block] = asyncio.ensure_future(
+                    self.fs._read(
+                        self.path,
+                        start=block * bs,
+                        end=min((block + 1) * bs, self.size),
+                    )
+                )
+
+        parts = await asyncio.gather(*(self._blocks[b] for b in range(first, last + 1)))
+        offset = first * bs
+        return b"".join(parts)[start - offset : end - offset]
+
+    async def readinto(self, b) -> int:
+        """Read up to ``len(b)`` bytes into the writable buffer ``b``
+
+        Returns the number of bytes read, as ``io.RawIOBase.readinto`` does.
+        """
+        out = memoryview(b).cast("B")
+        data = await self.read(out.nbytes)
+        out[: len(data)] = data
+        return len(data)
+
+    async def close(self) -> None:
+        """Close file, cancelling any outstanding prefetches"""
+        for block in self._blocks.values():
+            block.cancel()
+        self._blocks.clear()
+        await super().close()
+
+    async def _upload_chunk(self, final: bool = False) -> bool:
+        """Upload the buffered block, finishing the file on the final one"""
+        await _upload_block(self, final)
+        return True
 
 
 def test_exists(memory_fs, s3_fs):
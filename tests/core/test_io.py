@@ -1,6 +1,12 @@
 """Core functionality tests for IO operations."""
 
+import array
+import asyncio
+
 import pytest
+from fsspec.caching import BackgroundBlockCache, ReadAheadCache
+
+from opendalfs import OpendalFileSystem
 
 
 def test_write_read(memory_fs, s3_fs):
@@ -11,6 +17,203 @@ def test_write_read(memory_fs, s3_fs):
         assert fs.read("test.txt") == content
 
 
+def test_write_buffer_payloads(memory_fs, s3_fs):
+    """Test bytes-like payloads are written without changing their bytes."""
+    for fs in [memory_fs, s3_fs]:
+        payloads = {
+            "buffers/bytearray.bin": bytearray(b"bytearray payload"),
+            "buffers/memoryview.bin": memoryview(b"__memoryview payload__")[2:-2],
+            "buffers/array.bin": array.array("i", range(16)),
+        }
+        for path, data in payloads.items():
+            fs.write(path, data)
+            assert fs.read(path) == bytes(data)
+            fs.pipe_file(path, data)
+            assert fs.cat_file(path) == bytes(data)
+        with pytest.raises(TypeError):
+            fs.write("buffers/int.bin", 42)
+        with pytest.raises(TypeError):
+            fs.pipe_file("buffers/int.bin", 42)
+
+
+def test_pipe_cat_many(memory_fs, s3_fs):
+    """Test concurrent multi-file pipe and cat."""
+    for fs in [memory_fs, s3_fs]:
+        files = {f"many/file-{i}.bin": f"content {i}".encode() for i in range(8)}
+        fs.pipe(files)
+        assert fs.cat(list(files)) == files
+        assert fs.cat_file("many/file-3.bin", start=2, end=5) == b"nte"
+        assert fs.cat_file("many/file-3.bin", start=-3) == b"t 3"
+        size = len(files["many/file-3.bin"])
+        assert fs.cat_file("many/file-3.bin", 0, size + 10) == b"content 3"
+        assert fs.cat_file("many/file-3.bin", size + 1) == b""
+        with pytest.raises(FileExistsError):
+            fs.pipe_file("many/file-3.bin", b"new", mode="create")
+        assert fs.cat_file("many/file-3.bin") == b"content 3"
+        fs.pipe_file("many/created.bin", b"new", mode="create")
+        assert fs.cat_file("many/created.bin") == b"new"
+
+
+def test_write_multiple_blocks(memory_fs, s3_fs):
+    """Test writes spanning several buffer flushes keep every block."""
+    for fs in [memory_fs, s3_fs]:
+        with fs.open("blocks.bin", "wb", block_size=5 * 2**20) as f:
+            for i in range(4):
+                f.write(bytes([i]) * 2 * 2**20)
+        assert fs.cat_file("blocks.bin") == b"".join(
+            bytes([i]) * 2 * 2**20 for i in range(4)
+        )
+
+
+@pytest.mark.asyncio
+async def test_open_defaults(memory_fs):
+    """Test opened files use the filesystem's default block size and cache."""
+    memory_fs.pipe_file("defaults.bin", b"content")
+    with memory_fs.open("defaults.bin", "rb") as f:
+        assert f.blocksize == 50 * 2**20
+        assert type(f.cache) is ReadAheadCache
+
+    fs = OpendalFileSystem(
+        "memory",
+        asynchronous=False,
+        default_block_size=2**20,
+        default_cache_type="background",
+        skip_instance_cache=True,
+    )
+    fs.pipe_file("defaults.bin", b"content")
+    with fs.open("defaults.bin", "rb") as f:
+        assert f.blocksize == 2**20
+        assert type(f.cache) is BackgroundBlockCache
+        assert f.read() == b"content"
+    async with await fs.open_async("defaults.bin", "rb") as f:
+        assert f.blocksize == 2**20
+
+
+def test_concurrent_chunked_io(memory_fs, s3_fs):
+    """Test round-trips through concurrent, chunked reads and writes."""
+    content = bytes(range(256)) * (12 * 2**20 // 256)
+    for base in [memory_fs, s3_fs]:
+        options = {**base.storage_options, "skip_instance_cache": True}
+        fs = OpendalFileSystem(
+            *base.storage_args, read_concurrent=4, read_chunk=2**20, **options
+        )
+        with fs.open(
+            "chunked/open.bin", "wb", write_concurrent=4, write_chunk=5 * 2**20
+        ) as f:
+            f.write(content)
+        fs.pipe_file(
+            "chunked/pipe.bin", content, write_concurrent=4, write_chunk=5 * 2**20
+        )
+        for path in ["chunked/open.bin", "chunked/pipe.bin"]:
+            assert fs.cat_file(path) == content
+            assert (
+                fs.cat_file(path, start=3 * 2**20 + 7, end=9 * 2**20)
+                == (content[3 * 2**20 + 7 : 9 * 2**20])
+            )
+
+
+def test_cat_ranges_max_gap(memory_fs, s3_fs):
+    """Test nearby ranges are merged and split back per request."""
+    for fs in [memory_fs, s3_fs]:
+        content = bytes(range(256))
+        fs.pipe({"ranges/a.bin": content, "ranges/b.bin": content[::-1]})
+        paths = ["ranges/a.bin", "ranges/b.bin", "ranges/a.bin", "ranges/a.bin"]
+        starts = [100, 0, 0, 10]
+        ends = [None, 4, 5, 20]
+        expected = [content[100:], content[::-1][:4], content[:5], content[10:20]]
+        assert fs.cat_ranges(paths, starts, ends, max_gap=8) == expected
+        assert fs.cat_ranges(paths, tuple(starts), tuple(ends)) == expected
+        assert fs.cat_ranges(paths, tuple(starts), tuple(ends), max_gap=8) == expected
+
+
+@pytest.mark.asyncio
+async def test_open_async(memory_fs, s3_fs):
+    """Test concurrent writes and reads through async file objects."""
+
+    async def write_one(fs, path, content):
+        async with await fs.open_async(path, "wb") as f:
+            await f.write(content)
+
+    async def read_one(fs, path):
+        async with await fs.open_async(path, "rb") as f:
+            return await f.read()
+
+    for fs in [memory_fs, s3_fs]:
+        files = {f"async/file-{i}.bin": f"content {i}".encode() for i in range(8)}
+        await asyncio.gather(*(write_one(fs, p, c) for p, c in files.items()))
+        contents = await asyncio.gather(*(read_one(fs, p) for p in files))
+        assert contents == list(files.values())
+
+
+@pytest.mark.asyncio
+async def test_open_async_readinto(memory_fs, s3_fs):
+    """Test reading into a pre-allocated buffer through an async file."""
+    for fs in [memory_fs, s3_fs]:
+        fs.pipe_file("async/readinto.bin", b"0123456789")
+        buf = bytearray(4)
+        async with await fs.open_async("async/readinto.bin", "rb") as f:
+            assert await f.readinto(buf) == 4
+            assert buf == b"0123"
+            f.seek(8)
+            assert await f.readinto(buf) == 2
+            assert buf[:2] == b"89"
+            assert await f.readinto(buf) == 0
+            assert await f.read(4) == b""
+
+
+@pytest.mark.asyncio
+async def test_open_async_prefetch(memory_fs, s3_fs):
+    """Test reads through an async file with background block prefetch."""
+    for fs in [memory_fs, s3_fs]:
+        content = bytes(range(256)) * 40
+        fs.pipe_file("async/prefetch.bin", content)
+        async with await fs.open_async(
+            "async/prefetch.bin", "rb", block_size=1000, prefetch=3
+        ) as f:
+            assert await f.read(10) == content[:10]
+            assert await f.read(2500) == content[10:2510]
+            f.seek(9000)
+            assert await f.read() == content[9000:]
+            f.seek(0)
+            assert await f.read(10) == content[:10]
+            assert len(f._blocks) <= 1 + f.prefetch
+
+
+def test_append(memory_fs, s3_fs):
+    """Test append mode on existing and missing files."""
+    for fs in [memory_fs, s3_fs]:
+        fs.pipe_file("append/existing.bin", b"abc")
+        with fs.open("append/existing.bin", "ab") as f:
+            f.write(b"def")
+        assert fs.cat_file("append/existing.bin") == b"abcdef"
+        fs.open("append/existing.bin", "ab").close()
+        assert fs.cat_file("append/existing.bin") == b"abcdef"
+        with fs.open("append/missing.bin", "ab") as f:
+            f.write(b"new")
+        assert fs.cat_file("append/missing.bin") == b"new"
+        fs.open("append/empty.bin", "ab").close()
+        assert fs.cat_file("append/empty.bin") == b""
+
+
+@pytest.mark.asyncio
+async def test_open_async_append(memory_fs, s3_fs):
+    """Test append mode through async file objects."""
+    for fs in [memory_fs, s3_fs]:
+        fs.pipe_file("async/append.bin", b"abc")
+        async with await fs.open_async("async/append.bin", "ab") as f:
+            await f.write(b"def")
+        assert fs.cat_file("async/append.bin") == b"abcdef"
+        async with await fs.open_async("async/append.bin", "ab"):
+            pass
+        assert fs.cat_file("async/append.bin") == b"abcdef"
+        async with await fs.open_async("async/append-missing.bin", "ab") as f:
+            await f.write(b"new")
+        assert fs.cat_file("async/append-missing.bin") == b"new"
+        async with await fs.open_async("async/append-empty.bin", "ab"):
+            pass
+        assert fs.cat_file("async/append-empty.bin") == b""
+
+
 def test_write_errors(memory_fs, s3_fs):
     """Test error cases for write operations."""
     for fs in [memory_fs, s3_fs]: